@@ -1,12 +1,72 @@
 #coding:utf-8
 
+import gzip
+import hashlib
+import StringIO
+
 import views
-from  web import form
 import web
+from utils import settings
+
+def _static_page(uri):
+    """Renders a template that takes no parameters once, and returns its
+    body, as is and gzipped, each with its Content-Length and ETag."""
+    body = views.Template(uri).render()
+    etag = hashlib.md5(body).hexdigest()
+    buf = StringIO.StringIO()
+    f = gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=9)
+    f.write(body)
+    f.close()
+    gzipped = buf.getvalue()
+    return web.storage(uri=uri,
+                       plain=(body, str(len(body)), etag),
+                       gzip=(gzipped, str(len(gzipped)), etag + "-gzip"))
+
+def _accepts_gzip(accept_encoding):
+    """Tells whether an Accept-Encoding header allows a gzip response,
+    i.e. lists gzip, or else *, without q=0."""
+    qvalues = {}
+    for token in accept_encoding.split(","):
+        params = token.split(";")
+        coding = params[0].strip().lower()
+        q = 1.0
+        for param in params[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qvalues:
+            return qvalues[coding] > 0
+    return False
+
+def _serve(page):
+    if settings.template_reload:
+        # pick up changes to the template
+        page = _static_page(page.uri)
+    web.header("Vary", "Accept-Encoding")
+    use_gzip = _accepts_gzip(web.ctx.env.get("HTTP_ACCEPT_ENCODING", ""))
+    body, length, etag = use_gzip and page.gzip or page.plain
+    if web.ctx.method in ("GET", "HEAD"):
+        # answers 304 Not Modified when the client already has this version
+        web.modified(etag=etag)
+    if use_gzip:
+        web.header("Content-Encoding", "gzip")
+    web.header("Content-Type", "text/html; charset=utf-8")
+    web.header("Content-Length", length)
+    return body
+
+_INDEX_PAGE = _static_page("base")
+_LOGIN_PAGE = _static_page("login")
+_REGISTER_PAGE = _static_page("register")
+_EDITOR_TEMPLATE = views.Template("editor")
 
 class index:
     def GET(self):
-        return views.Template("base").render() 
+        return _serve(_INDEX_PAGE)
     
 class login:
     def GET(self):
@@ -14,7 +74,7 @@ class login:
         uid = params.get("uid", None)
         if uid and uid=="3333":
             return web.seeother("/")
-        return views.Template("login").render()
+        return _serve(_LOGIN_PAGE)
     
     def POST(self):
         params = web.input()
@@ -22,22 +82,27 @@ class login:
             web.setcookie("uid", "3333")
             return web.seeother("/")
         #
-        return views.Template("login").render()
+        return _serve(_LOGIN_PAGE)
             
         
       
 class register:
     def GET(self):
-        return views.Template("register").render()
+        return _serve(_REGISTER_PAGE)
     
     def POST(self):
-        return views.Template("register").render()
+        return _serve(_REGISTER_PAGE)
+
+def _editor_template():
+    if settings.template_reload:
+        return views.Template("editor")
+    return _EDITOR_TEMPLATE
 
 class editor:
     def GET(self):
-        return views.Template("editor").render(content=a)
+        return _editor_template().render(content=a)
     
     def POST(self):
 
         a = web.input().idc
-        return views.Template("editor").render(content=a)
\ No newline at end of file
+        return _editor_template().render(content=a)
\ No newline at end of file
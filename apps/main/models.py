@@ -1,31 +1,47 @@
 #coding:utf-8
 
-from sqlalchemy import *
+from sqlalchemy import Column, Integer, String, DateTime, TIMESTAMP, TEXT, ForeignKey
+from sqlalchemy.orm import relationship, deferred, subqueryload
 from utils.model import BaseModel, Session
 
 class User(BaseModel):
-    __table__ = "users"
+    __tablename__ = "users"
+    _hot_columns = frozenset(["account", "password"])
     
     id = Column(Integer, primary_key=True)
-    account = Column(String)
+    account = Column(String(64), unique=True, index=True, nullable=False)
     password = Column(String)
     nickname = Column(String)
-    email = Column(String)
+    email = Column(String(128), unique=True, index=True)
     registered = Column(DateTime)
     group_id = Column(Integer)
+
+    # loaded when accessed, see `listing` to fetch the posts of many
+    # users at once
+    posts = relationship("Post", back_populates="author_user")
+
+    @classmethod
+    def listing(cls, session):
+        """Returns a query for users which loads the posts of all the
+        users it fetches in one extra query, instead of one per user."""
+        return session.query(cls).options(subqueryload(cls.posts))
     
     
 class Post(BaseModel):
-    __table__ = "posts"
+    __tablename__ = "posts"
+    _hot_columns = frozenset(["title", "status"])
     
     id = Column(Integer, primary_key=True)
-    user_id =  Column(Integer)
+    user_id =  Column(Integer, ForeignKey("users.id"), index=True)
     author = Column(String)
     created = Column(TIMESTAMP)
     modified = Column(DateTime)
-    title = Column(String(100))
-    content = Column(TEXT)
-    status = Column(Integer)
+    title = Column(String(100), index=True)
+    # only loaded when accessed, listings need the title alone
+    content = deferred(Column(TEXT))
+    status = Column(Integer, index=True)
     type_id = Column(Integer)
     tag_id = Column(Integer)
+
+    author_user = relationship("User", back_populates="posts")
     
\ No newline at end of file
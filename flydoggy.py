@@ -2,11 +2,12 @@
 import sys
 import os
 
-current_path = os.path.dirname(__file__)
-sys.path.append(current_path)
-sys.path.append(os.path.join(current_path, "libs"))
+current_path = os.path.dirname(os.path.abspath(__file__))
+for path in (current_path, os.path.join(current_path, "libs")):
+    if path not in sys.path:
+        sys.path.append(path)
 
-import web
-from runserver import application
+from runserver import application as app
 
-application = application.wsgifunc()
+# keep the web.application around so its url mapping can be reused
+application = app.wsgifunc()
@@ -4,6 +4,13 @@ Copyright (C) 2010 Gaetan de Menten gdementen@gmail.com
 
 This module is part of SQLAlchemy and is released under
 the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+UnicodeBindProcessor and DialectProcessor are only available when this
+file is built into sqlalchemy/cprocessors.so outside of this tree, e.g.
+  gcc -shared -fPIC -O2 -I<python include dir> processors.c \
+      -o ../cprocessors.so
+sqlalchemy/processors.py falls back to Python versions of them, and of
+the other processors, when the extension or these types are missing.
 */
 
 #include <Python.h>
@@ -147,12 +154,27 @@ typedef struct {
     PyObject *errors;
 } UnicodeResultProcessor;
 
+typedef struct {
+    PyObject_HEAD
+    PyObject *encoding;
+    PyObject *errors;
+    PyObject *warn;
+} UnicodeBindProcessor;
+
 typedef struct {
     PyObject_HEAD
     PyObject *type;
     PyObject *format;
 } DecimalResultProcessor;
 
+typedef struct {
+    PyObject_HEAD
+    PyObject *func;
+    PyObject *dialect;
+    PyObject *before;
+    PyObject *after;
+} DialectProcessor;
+
 
 
 /**************************
@@ -260,6 +282,114 @@ static PyTypeObject UnicodeResultProcessorType = {
     0,                                          /* tp_new */
 };
 
+/************************
+ * UnicodeBindProcessor *
+ ************************/
+
+static int
+UnicodeBindProcessor_init(UnicodeBindProcessor *self, PyObject *args,
+                          PyObject *kwds)
+{
+    PyObject *encoding, *errors = NULL, *warn = Py_None;
+    static char *kwlist[] = {"encoding", "errors", "warn", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "S|SO:__init__", kwlist,
+                                     &encoding, &errors, &warn))
+        return -1;
+
+    Py_INCREF(encoding);
+    self->encoding = encoding;
+
+    /* errors is left NULL for "strict", so that PyUnicode_AsEncodedString
+       can take its shortcuts for utf-8, latin-1 and ascii */
+    Py_XINCREF(errors);
+    self->errors = errors;
+
+    Py_INCREF(warn);
+    self->warn = warn;
+
+    return 0;
+}
+
+static PyObject *
+UnicodeBindProcessor_process(UnicodeBindProcessor *self, PyObject *value)
+{
+    PyObject *result;
+
+    if (PyUnicode_Check(value))
+        return PyUnicode_AsEncodedString(value,
+                                         PyString_AS_STRING(self->encoding),
+                                         self->errors == NULL ? NULL :
+                                         PyString_AS_STRING(self->errors));
+
+    if (self->warn != Py_None && value != Py_None) {
+        result = PyObject_CallFunctionObjArgs(self->warn, NULL);
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+
+    Py_INCREF(value);
+    return value;
+}
+
+static void
+UnicodeBindProcessor_dealloc(UnicodeBindProcessor *self)
+{
+    Py_XDECREF(self->encoding);
+    Py_XDECREF(self->errors);
+    Py_XDECREF(self->warn);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyMethodDef UnicodeBindProcessor_methods[] = {
+    {"process", (PyCFunction)UnicodeBindProcessor_process, METH_O,
+     "The value processor itself."},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject UnicodeBindProcessorType = {
+    PyObject_HEAD_INIT(NULL)
+    0,                                          /* ob_size */
+    "sqlalchemy.cprocessors.UnicodeBindProcessor",          /* tp_name */
+    sizeof(UnicodeBindProcessor),               /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)UnicodeBindProcessor_dealloc,   /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_compare */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash  */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
+    "UnicodeBindProcessor objects",             /* tp_doc */
+    0,                                          /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    UnicodeBindProcessor_methods,               /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    (initproc)UnicodeBindProcessor_init,        /* tp_init */
+    0,                                          /* tp_alloc */
+    0,                                          /* tp_new */
+};
+
 /**************************
  * DecimalResultProcessor *
  **************************/
@@ -365,6 +495,136 @@ static PyTypeObject DecimalResultProcessorType = {
     0,                                          /* tp_new */
 };
 
+/********************
+ * DialectProcessor *
+ ********************/
+
+static int
+DialectProcessor_init(DialectProcessor *self, PyObject *args,
+                      PyObject *kwds)
+{
+    PyObject *func, *dialect, *before = Py_None, *after = Py_None;
+    static char *kwlist[] = {"func", "dialect", "before", "after", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:__init__", kwlist,
+                                     &func, &dialect, &before, &after))
+        return -1;
+
+    Py_INCREF(func);
+    self->func = func;
+    Py_INCREF(dialect);
+    self->dialect = dialect;
+    Py_INCREF(before);
+    self->before = before;
+    Py_INCREF(after);
+    self->after = after;
+
+    return 0;
+}
+
+static PyObject *
+DialectProcessor_process(DialectProcessor *self, PyObject *value)
+{
+    PyObject *result;
+
+    if (self->before != Py_None) {
+        value = PyObject_CallFunctionObjArgs(self->before, value, NULL);
+        if (value == NULL)
+            return NULL;
+    } else {
+        Py_INCREF(value);
+    }
+
+    result = PyObject_CallFunctionObjArgs(self->func, value, self->dialect,
+                                          NULL);
+    Py_DECREF(value);
+
+    if (result == NULL || self->after == Py_None)
+        return result;
+
+    value = result;
+    result = PyObject_CallFunctionObjArgs(self->after, value, NULL);
+    Py_DECREF(value);
+    return result;
+}
+
+static int
+DialectProcessor_traverse(DialectProcessor *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->func);
+    Py_VISIT(self->dialect);
+    Py_VISIT(self->before);
+    Py_VISIT(self->after);
+    return 0;
+}
+
+static int
+DialectProcessor_clear(DialectProcessor *self)
+{
+    Py_CLEAR(self->func);
+    Py_CLEAR(self->dialect);
+    Py_CLEAR(self->before);
+    Py_CLEAR(self->after);
+    return 0;
+}
+
+static void
+DialectProcessor_dealloc(DialectProcessor *self)
+{
+    PyObject_GC_UnTrack(self);
+    DialectProcessor_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyMethodDef DialectProcessor_methods[] = {
+    {"process", (PyCFunction)DialectProcessor_process, METH_O,
+     "The value processor itself."},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject DialectProcessorType = {
+    PyObject_HEAD_INIT(NULL)
+    0,                                          /* ob_size */
+    "sqlalchemy.cprocessors.DialectProcessor",  /* tp_name */
+    sizeof(DialectProcessor),                   /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)DialectProcessor_dealloc,       /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_compare */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash  */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+        Py_TPFLAGS_HAVE_GC,                     /* tp_flags */
+    "DialectProcessor objects",                 /* tp_doc */
+    (traverseproc)DialectProcessor_traverse,    /* tp_traverse */
+    (inquiry)DialectProcessor_clear,            /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    DialectProcessor_methods,                   /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    (initproc)DialectProcessor_init,            /* tp_init */
+    0,                                          /* tp_alloc */
+    0,                                          /* tp_new */
+};
+
 #ifndef PyMODINIT_FUNC  /* declarations for DLL import/export */
 #define PyMODINIT_FUNC void
 #endif
@@ -395,10 +655,18 @@ initcprocessors(void)
     if (PyType_Ready(&UnicodeResultProcessorType) < 0)
         return;
 
+    UnicodeBindProcessorType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&UnicodeBindProcessorType) < 0)
+        return;
+
     DecimalResultProcessorType.tp_new = PyType_GenericNew;
     if (PyType_Ready(&DecimalResultProcessorType) < 0)
         return;
 
+    DialectProcessorType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&DialectProcessorType) < 0)
+        return;
+
     m = Py_InitModule3("cprocessors", module_methods,
                        "Module containing C versions of data processing functions.");
     if (m == NULL)
@@ -410,8 +678,16 @@ initcprocessors(void)
     PyModule_AddObject(m, "UnicodeResultProcessor",
                        (PyObject *)&UnicodeResultProcessorType);
 
+    Py_INCREF(&UnicodeBindProcessorType);
+    PyModule_AddObject(m, "UnicodeBindProcessor",
+                       (PyObject *)&UnicodeBindProcessorType);
+
     Py_INCREF(&DecimalResultProcessorType);
     PyModule_AddObject(m, "DecimalResultProcessor",
                        (PyObject *)&DecimalResultProcessorType);
+
+    Py_INCREF(&DialectProcessorType);
+    PyModule_AddObject(m, "DialectProcessor",
+                       (PyObject *)&DialectProcessorType);
 }
 
@@ -3172,15 +3172,14 @@ class FullyBufferedResultProxy(ResultProxy):
 
 class BufferedColumnRow(RowProxy):
     def __init__(self, parent, row, processors, keymap):
-        # preprocess row
-        row = list(row)
-        # this is a tad faster than using enumerate
-        index = 0
-        for processor in parent._orig_processors:
-            if processor is not None:
+        # preprocess row; only the columns which have a processor
+        # are visited
+        orig_processors = parent._orig_processors
+        if orig_processors:
+            row = list(row)
+            for index, processor in orig_processors:
                 row[index] = processor(row[index])
-            index += 1
-        row = tuple(row)
+            row = tuple(row)
         super(BufferedColumnRow, self).__init__(parent, row,
                                                 processors, keymap)
 
@@ -3202,8 +3201,12 @@ class BufferedColumnResultProxy(ResultProxy):
         super(BufferedColumnResultProxy, self)._init_metadata()
         metadata = self._metadata
         # orig_processors will be used to preprocess each row when they are
-        # constructed.
-        metadata._orig_processors = metadata._processors
+        # constructed.  Columns without a processor are left out, so
+        # that rows don't pay for them.
+        metadata._orig_processors = [(index, processor)
+                            for index, processor
+                            in enumerate(metadata._processors)
+                            if processor is not None]
         # replace the all type processors by None processors.
         metadata._processors = [None for _ in xrange(len(metadata.keys))]
         keymap = {}
@@ -156,6 +156,18 @@ class DefaultDialect(base.Dialect):
     def _type_memos(self):
         return weakref.WeakKeyDictionary()
 
+    @util.memoized_property
+    def _bind_processor_memos(self):
+        return weakref.WeakKeyDictionary()
+
+    @util.memoized_property
+    def _type_memos_by_key(self):
+        return {}
+
+    @util.memoized_property
+    def _adapt_type_memos(self):
+        return {}
+
     @property
     def dialect_description(self):
         return self.name + "+" + self.driver
@@ -252,7 +264,8 @@ class DefaultDialect(base.Dialect):
         and passes on to ``types.adapt_type()``.
 
         """
-        return sqltypes.adapt_type(typeobj, self.colspecs)
+        return sqltypes.adapt_type(typeobj, self.colspecs,
+                                   self._adapt_type_memos)
 
     def reflecttable(self, connection, table, include_columns):
         insp = reflection.Inspector.from_engine(connection)
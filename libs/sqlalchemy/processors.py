@@ -110,3 +110,56 @@ except ImportError:
     str_to_time = str_to_datetime_processor_factory(TIME_RE, datetime.time)
     str_to_date = str_to_datetime_processor_factory(DATE_RE, datetime.date)
 
+# UnicodeBindProcessor and DialectProcessor are newer than the
+# processors above and are imported on their own, so an extension
+# built before they were added still provides those.  This tree has
+# no build step for the extension: cextension/processors.c has to be
+# compiled into sqlalchemy/cprocessors.so separately, otherwise the
+# Python versions below are used.
+try:
+    from sqlalchemy.cprocessors import UnicodeBindProcessor
+
+    def to_encoded_processor_factory(encoding, errors=None, warn=None):
+        if errors is not None:
+            return UnicodeBindProcessor(encoding, errors, warn).process
+        else:
+            return UnicodeBindProcessor(encoding, warn=warn).process
+
+except ImportError:
+    def to_encoded_processor_factory(encoding, errors=None, warn=None):
+        encoder = codecs.getencoder(encoding)
+
+        # the codecs encoder is faster than unicode.encode(), which
+        # looks the codec up by name on each call
+        def process(value, encoder=encoder, errors=errors, warn=warn):
+            if isinstance(value, unicode):
+                return encoder(value, errors)[0]
+            elif warn is not None and value is not None:
+                warn()
+            return value
+        return process
+
+try:
+    from sqlalchemy.cprocessors import DialectProcessor
+
+    def dialect_processor_factory(func, dialect, before=None, after=None):
+        return DialectProcessor(func, dialect, before, after).process
+
+except ImportError:
+    def dialect_processor_factory(func, dialect, before=None, after=None):
+        # the callables are bound as default arguments, which are
+        # read as fast locals instead of closure cells on each call
+        if before is not None and after is not None:
+            def process(value, func=func, dialect=dialect,
+                        before=before, after=after):
+                return after(func(before(value), dialect))
+        elif before is not None:
+            def process(value, func=func, dialect=dialect, before=before):
+                return func(before(value), dialect)
+        elif after is not None:
+            def process(value, func=func, dialect=dialect, after=after):
+                return after(func(value, dialect))
+        else:
+            def process(value, func=func, dialect=dialect):
+                return func(value, dialect)
+        return process
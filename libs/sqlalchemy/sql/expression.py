@@ -2530,8 +2530,7 @@ class _BindParamClause(ColumnElement):
                     _compared_to_type._coerce_compared_value(
                         _compared_to_operator, value)
             else:
-                self.type = sqltypes._type_map.get(type(value),
-                        sqltypes.NULLTYPE)
+                self.type = sqltypes._resolve_type(type(value))
         elif isinstance(type_, type):
             self.type = type_()
         else:
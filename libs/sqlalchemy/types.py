@@ -22,7 +22,7 @@ __all__ = [ 'TypeEngine', 'TypeDecorator', 'AbstractType', 'UserDefinedType',
 
 import inspect
 import datetime as dt
-import codecs
+import weakref
 
 from sqlalchemy import exc, schema
 from sqlalchemy.sql import expression, operators
@@ -38,6 +38,35 @@ NoneType = type(None)
 if util.jython:
     import array
 
+_MEMO_UNSET = util.symbol('_MEMO_UNSET')
+
+# values considered by TypeEngine._memo_key()
+_memo_key_value_types = frozenset([NoneType, bool, int, long, float,
+                                   str, unicode])
+
+# attributes types cache in their __dict__, which _memo_key() ignores
+# and which are left out when a type is pickled or copied
+_cached_attributes = frozenset(['_repr', '_str', '_type_affinity',
+                                '_create_constraint_rule',
+                                '_expression_adaptation_map'])
+
+class _TypeMemo(object):
+    """The dialect-specific implementation of a type, along with its
+    result processors, as stored in ``dialect._type_memos``.  Bind
+    processors are stored in ``dialect._bind_processor_memos``.
+
+    ``results`` stays ``None`` until a result processor is asked for,
+    as many types (those of bound parameters in particular) never
+    need one.
+
+    """
+
+    __slots__ = ('impl', 'results')
+
+    def __init__(self, impl):
+        self.impl = impl
+        self.results = None
+
 class AbstractType(Visitable):
     """Base for all types - not needed except for backwards 
     compatibility."""
@@ -81,7 +110,9 @@ class TypeEngine(AbstractType):
     def compare_values(self, x, y):
         """Compare two values for equality."""
 
-        return x == y
+        # identity settles the common cases (None, small ints,
+        # unchanged attributes) without calling __eq__()
+        return x is y or x == y
 
     def is_mutable(self):
         """Return True if the target Python type is 'mutable'.
@@ -154,61 +185,103 @@ class TypeEngine(AbstractType):
         """Return a rudimental 'affinity' value expressing the general class
         of type."""
 
+        # depends on the class alone, so the __mro__ is walked once
+        # per class rather than once per instance
+        cls = self.__class__
+        try:
+            return cls.__dict__['_type_affinity_cls']
+        except KeyError:
+            cls._type_affinity_cls = typ = cls._compute_type_affinity()
+            return typ
+
+    @classmethod
+    def _compute_type_affinity(cls):
         typ = None
-        for t in self.__class__.__mro__:
+        for t in cls.__mro__:
             if t is TypeEngine or t is UserDefinedType:
                 return typ
             elif issubclass(t, TypeEngine):
                 typ = t
         else:
-            return self.__class__
+            return cls
 
     def dialect_impl(self, dialect):
         """Return a dialect-specific implementation for this :class:`.TypeEngine`."""
 
-        try:
-            return dialect._type_memos[self]['impl']
-        except KeyError:
-            return self._dialect_info(dialect)['impl']
+        return (dialect._type_memos.get(self) or
+                    self._dialect_info(dialect)).impl
 
     def _cached_bind_processor(self, dialect):
         """Return a dialect-specific bind processor for this type."""
 
-        try:
-            return dialect._type_memos[self]['bind']
-        except KeyError:
-            d = self._dialect_info(dialect)
-            d['bind'] = bp = d['impl'].bind_processor(dialect)
-            return bp
+        # kept apart from the _TypeMemo so that, once warm, this is a
+        # single lookup per bound parameter
+        memos = dialect._bind_processor_memos
+        bp = memos.get(self, _MEMO_UNSET)
+        if bp is _MEMO_UNSET:
+            memos[self] = bp = self.dialect_impl(dialect).\
+                                    bind_processor(dialect)
+        return bp
 
     def _cached_result_processor(self, dialect, coltype):
-        """Return a dialect-specific result processor for this type."""
-
-        try:
-            return dialect._type_memos[self][coltype]
-        except KeyError:
-            d = self._dialect_info(dialect)
+        """Return a dialect-specific result processor for this type,
+        or None if values of this type are returned as is."""
+
+        memo = dialect._type_memos.get(self) or self._dialect_info(dialect)
+        results = memo.results
+        if results is None:
+            results = memo.results = {}
+        rp = results.get(coltype, _MEMO_UNSET)
+        if rp is _MEMO_UNSET:
             # key assumption: DBAPI type codes are
             # constants.  Else this dictionary would
             # grow unbounded.
-            d[coltype] = rp = d['impl'].result_processor(dialect, coltype)
-            return rp
+            results[coltype] = rp = \
+                        memo.impl.result_processor(dialect, coltype)
+        return rp
 
     def _dialect_info(self, dialect):
         """Return a dialect-specific registry which 
-        caches a dialect-specific implementation, bind processing
-        function, and one or more result processing functions."""
+        caches a dialect-specific implementation and one or more
+        result processing functions.
 
-        if self in dialect._type_memos:
-            return dialect._type_memos[self]
-        else:
-            impl = self._gen_dialect_impl(dialect)
-            if impl is self:
-                impl = self.adapt(type(self))
-            # this can't be self, else we create a cycle
-            assert impl is not self
-            dialect._type_memos[self] = d = {'impl':impl}
-            return d
+        Types of the same class constructed with the same plain
+        arguments (see :meth:`_memo_key`) share one registry.
+
+        """
+
+        memo = dialect._type_memos.get(self)
+        if memo is None:
+            key = self._memo_key()
+            if key is not None:
+                memo = dialect._type_memos_by_key.get(key)
+            if memo is None:
+                impl = self._gen_dialect_impl(dialect)
+                if impl is self:
+                    impl = self.adapt(type(self))
+                # this can't be self, else we create a cycle
+                assert impl is not self
+                memo = _TypeMemo(impl)
+                if key is not None:
+                    dialect._type_memos_by_key[key] = memo
+            dialect._type_memos[self] = memo
+        return memo
+
+    def _memo_key(self):
+        """Return a hashable key describing this type's class and
+        state, or None if the state holds anything other than plain
+        immutable values, in which case the type gets a registry of
+        its own."""
+
+        items = []
+        for key, value in self.__dict__.iteritems():
+            if key in _cached_attributes:
+                continue
+            cls = value.__class__
+            if cls not in _memo_key_value_types:
+                return None
+            items.append((key, cls, value))
+        return self.__class__, frozenset(items)
 
     def _gen_dialect_impl(self, dialect):
         return dialect.type_descriptor(self)
@@ -242,7 +315,7 @@ class TypeEngine(AbstractType):
         end-user customization of this behavior.
 
         """
-        _coerced_type = _type_map.get(type(value), NULLTYPE)
+        _coerced_type = _resolve_type(type(value))
         if _coerced_type is NULLTYPE or _coerced_type._type_affinity \
             is self._type_affinity:
             return self
@@ -271,20 +344,36 @@ class TypeEngine(AbstractType):
 
     @property
     def _default_dialect(self):
-        if self.__class__.__module__.startswith("sqlalchemy.dialects"):
-            tokens = self.__class__.__module__.split(".")[0:3]
-            mod = ".".join(tokens)
-            return getattr(__import__(mod).dialects, tokens[-1]).dialect()
-        else:
-            return default.DefaultDialect()
+        # one dialect instance per module, which is only used to
+        # compile types
+        modname = self.__class__.__module__
+        try:
+            return _default_dialects[modname]
+        except KeyError:
+            if modname.startswith("sqlalchemy.dialects"):
+                tokens = modname.split(".")[0:3]
+                mod = ".".join(tokens)
+                dialect = getattr(__import__(mod).dialects,
+                                        tokens[-1]).dialect()
+            else:
+                dialect = default.DefaultDialect()
+            _default_dialects[modname] = dialect
+            return dialect
 
     def __str__(self):
-        # Py3K
-        #return unicode(self.compile())
-        # Py2K
-        return unicode(self.compile()).\
+        # types don't change once constructed, so the string
+        # form is computed only once
+        try:
+            return self.__dict__['_str']
+        except KeyError:
+            # Py3K
+            #s = unicode(self.compile())
+            # Py2K
+            s = unicode(self.compile()).\
                         encode('ascii', 'backslashreplace')
-        # end Py2K
+            # end Py2K
+            self.__dict__['_str'] = s
+            return s
 
     def __init__(self, *args, **kwargs):
         """Support implementations that were passing arguments"""
@@ -293,7 +382,18 @@ class TypeEngine(AbstractType):
                     "constructor %s is deprecated" % self.__class__)
 
     def __repr__(self):
-        return util.generic_repr(self)
+        try:
+            return self.__dict__['_repr']
+        except KeyError:
+            self.__dict__['_repr'] = r = util.generic_repr(self)
+            return r
+
+    def __getstate__(self):
+        state = self.__dict__
+        if not _cached_attributes.isdisjoint(state):
+            state = dict((k, v) for k, v in state.iteritems()
+                         if k not in _cached_attributes)
+        return state
 
 class UserDefinedType(TypeEngine):
     """Base for user defined types.
@@ -445,13 +545,33 @@ class TypeDecorator(TypeEngine):
         of ``self.impl``.
 
         """
-        if not hasattr(self.__class__, 'impl'):
+        cls = self.__class__
+        try:
+            impl_factory = cls.__dict__['_impl_factory']
+        except KeyError:
+            impl_factory = cls._impl_factory = cls._get_impl_factory()
+        self.impl = impl_factory(*args, **kwargs)
+
+    @classmethod
+    def _get_impl_factory(cls):
+        """Return a callable producing ``self.impl`` from constructor
+        arguments, as :func:`.to_instance` would for ``cls.impl``.
+
+        This is resolved once per class, and stored in the class
+        ``__dict__`` as ``_impl_factory``.
+
+        """
+        if not hasattr(cls, 'impl'):
             raise AssertionError("TypeDecorator implementations "
                                  "require a class-level variable "
                                  "'impl' which refers to the class of "
                                  "type being decorated")
-        self.impl = to_instance(self.__class__.impl, *args, **kwargs)
-
+        impl = cls.impl
+        if impl is None:
+            impl = NULLTYPE
+        elif util.callable(impl):
+            return impl
+        return lambda *arg, **kw: impl
 
     def _gen_dialect_impl(self, dialect):
         adapted = dialect.type_descriptor(self)
@@ -542,6 +662,24 @@ class TypeDecorator(TypeEngine):
         """
         raise NotImplementedError()
 
+    def _overrides(self, name):
+        """Return True if the class of this :class:`.TypeDecorator`
+        overrides the method ``name``.
+
+        The answer is stored on that class itself, so it is computed
+        once per class rather than each time a processor is built.
+
+        """
+        cls = self.__class__
+        key = '_overrides_' + name
+        try:
+            return cls.__dict__[key]
+        except KeyError:
+            overrides = getattr(cls, name).func_code \
+                is not getattr(TypeDecorator, name).func_code
+            setattr(cls, key, overrides)
+            return overrides
+
     def bind_processor(self, dialect):
         """Provide a bound value processing function for the given :class:`.Dialect`.
 
@@ -555,19 +693,10 @@ class TypeDecorator(TypeEngine):
         the processing provided by ``self.impl`` is maintained.
 
         """
-        if self.__class__.process_bind_param.func_code \
-            is not TypeDecorator.process_bind_param.func_code:
-            process_param = self.process_bind_param
-            impl_processor = self.impl.bind_processor(dialect)
-            if impl_processor:
-                def process(value):
-                    return impl_processor(process_param(value, dialect))
-
-            else:
-                def process(value):
-                    return process_param(value, dialect)
-
-            return process
+        if self._overrides('process_bind_param'):
+            return processors.dialect_processor_factory(
+                        self.process_bind_param, dialect,
+                        after=self.impl.bind_processor(dialect) or None)
         else:
             return self.impl.bind_processor(dialect)
 
@@ -584,20 +713,11 @@ class TypeDecorator(TypeEngine):
         the processing provided by ``self.impl`` is maintained.
 
         """
-        if self.__class__.process_result_value.func_code \
-            is not TypeDecorator.process_result_value.func_code:
-            process_value = self.process_result_value
-            impl_processor = self.impl.result_processor(dialect,
-                    coltype)
-            if impl_processor:
-                def process(value):
-                    return process_value(impl_processor(value), dialect)
-
-            else:
-                def process(value):
-                    return process_value(value, dialect)
-
-            return process
+        if self._overrides('process_result_value'):
+            return processors.dialect_processor_factory(
+                        self.process_result_value, dialect,
+                        before=self.impl.result_processor(dialect,
+                                coltype) or None)
         else:
             return self.impl.result_processor(dialect, coltype)
 
@@ -634,7 +754,7 @@ class TypeDecorator(TypeEngine):
 
         """
         instance = self.__class__.__new__(self.__class__)
-        instance.__dict__.update(self.__dict__)
+        instance.__dict__.update(self.__getstate__())
         return instance
 
     def get_dbapi_type(self, dbapi):
@@ -832,6 +952,10 @@ class MutableType(object):
         return x == y
 
 def to_instance(typeobj, *arg, **kw):
+    # most often given an instance already
+    if isinstance(typeobj, TypeEngine):
+        return typeobj
+
     if typeobj is None:
         return NULLTYPE
 
@@ -840,25 +964,36 @@ def to_instance(typeobj, *arg, **kw):
     else:
         return typeobj
 
-def adapt_type(typeobj, colspecs):
+def adapt_type(typeobj, colspecs, _memos=None):
     if isinstance(typeobj, type):
         typeobj = typeobj()
-    for t in typeobj.__class__.__mro__[0:-1]:
-        try:
-            impltype = colspecs[t]
-            break
-        except KeyError:
-            pass
+    cls = typeobj.__class__
+    # _memos is a dictionary of type class -> (colspecs, class it
+    # adapts to or None) held by the caller, see
+    # DefaultDialect.type_descriptor()
+    entry = _memos is not None and _memos.get(cls) or None
+    if entry is not None and entry[0] is colspecs:
+        impltype = entry[1]
     else:
-        # couldnt adapt - so just return the type itself
+        # object is last in the __mro__ and never in colspecs, and
+        # colspecs values are never None
+        for t in cls.__mro__:
+            impltype = colspecs.get(t)
+            if impltype is not None:
+                break
+        # if we adapted the given generic type to a database-specific
+        # type, but it turns out the originally given "generic" type
+        # is actually a subclass of our resulting type (most often, the
+        # very same class), then we were already given a more specific
+        # type than that required; so use that.
+        if impltype is not None and issubclass(cls, impltype):
+            impltype = None
+        if _memos is not None:
+            _memos[cls] = colspecs, impltype
+    if impltype is None:
+        # couldnt adapt, or no need to - so just return the type itself
         # (it may be a user-defined type)
         return typeobj
-    # if we adapted the given generic type to a database-specific type,
-    # but it turns out the originally given "generic" type
-    # is actually a subclass of our resulting type, then we were already
-    # given a more specific type than that required; so use that.
-    if (issubclass(typeobj.__class__, impltype)):
-        return typeobj
     return typeobj.adapt(impltype)
 
 
@@ -892,11 +1027,17 @@ class Concatenable(object):
     typically strings."""
 
     def _adapt_expression(self, op, othertype):
-        if op is operators.add and issubclass(othertype._type_affinity,
-                (Concatenable, NullType)):
-            return operators.concat_op, self
-        else:
-            return op, self
+        if op is operators.add:
+            # issubclass() against the tuple is memoized per affinity
+            affinity = othertype._type_affinity
+            try:
+                concatenable = _concatenable_affinities[affinity]
+            except KeyError:
+                concatenable = _concatenable_affinities[affinity] = \
+                        issubclass(affinity, (Concatenable, NullType))
+            if concatenable:
+                return operators.concat_op, self
+        return op, self
 
 class _DateAffinity(object):
     """Mixin date/time specific expression adaptations.
@@ -911,12 +1052,28 @@ class _DateAffinity(object):
     def _expression_adaptations(self):
         raise NotImplementedError()
 
-    _blank_dict = util.immutabledict()
+    @util.memoized_property
+    def _expression_adaptation_map(self):
+        """``_expression_adaptations`` flattened into a dictionary
+        keyed on (operator, other type affinity)."""
+
+        # built once per class, from whatever _expression_adaptations
+        # the class supplies
+        cls = self.__class__
+        try:
+            return cls.__dict__['_expression_adaptation_map_cls']
+        except KeyError:
+            cls._expression_adaptation_map_cls = map_ = \
+                util.immutabledict(
+                    ((op, affinity), result)
+                    for op, adaptations
+                    in self._expression_adaptations.iteritems()
+                    for affinity, result in adaptations.iteritems())
+            return map_
+
     def _adapt_expression(self, op, othertype):
-        othertype = othertype._type_affinity
-        return op, \
-                self._expression_adaptations.get(op, self._blank_dict).\
-                get(othertype, NULLTYPE)
+        return op, self._expression_adaptation_map.get(
+                        (op, othertype._type_affinity), NULLTYPE)
 
 class String(Concatenable, TypeEngine):
     """The base for all string and character types.
@@ -1028,16 +1185,14 @@ class String(Concatenable, TypeEngine):
                 else:
                     return None
             else:
-                encoder = codecs.getencoder(dialect.encoding)
-                warn_on_bytestring = self._warn_on_bytestring
-                def process(value):
-                    if isinstance(value, unicode):
-                        return encoder(value, self.unicode_error)[0]
-                    elif warn_on_bytestring and value is not None:
+                if self._warn_on_bytestring:
+                    def warn():
                         util.warn("Unicode type received non-unicode bind "
                                   "param value")
-                    return value
-            return process
+                else:
+                    warn = None
+                return processors.to_encoded_processor_factory(
+                                    dialect.encoding, self.unicode_error, warn)
         else:
             return None
 
@@ -1176,37 +1331,6 @@ class Integer(_DateAffinity, TypeEngine):
     def get_dbapi_type(self, dbapi):
         return dbapi.NUMBER
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        # TODO: need a dictionary object that will
-        # handle operators generically here, this is incomplete
-        return {
-            operators.add:{
-                Date:Date,
-                Integer:Integer,
-                Numeric:Numeric,
-            },
-            operators.mul:{
-                Interval:Interval,
-                Integer:Integer,
-                Numeric:Numeric,
-            },
-            # Py2K
-            operators.div:{
-                Integer:Integer,
-                Numeric:Numeric,
-            },
-            # end Py2K
-            operators.truediv:{
-                Integer:Integer,
-                Numeric:Numeric,
-            },
-            operators.sub:{
-                Integer:Integer,
-                Numeric:Numeric,
-            },
-        }
-
 class SmallInteger(Integer):
     """A type for smaller ``int`` integers.
 
@@ -1344,34 +1468,6 @@ class Numeric(_DateAffinity, TypeEngine):
             else:
                 return None
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.mul:{
-                Interval:Interval,
-                Numeric:Numeric,
-                Integer:Numeric,
-            },
-            # Py2K
-            operators.div:{
-                Numeric:Numeric,
-                Integer:Numeric,
-            },
-            # end Py2K
-            operators.truediv:{
-                Numeric:Numeric,
-                Integer:Numeric,
-            },
-            operators.add:{
-                Numeric:Numeric,
-                Integer:Numeric,
-            },
-            operators.sub:{
-                Numeric:Numeric,
-                Integer:Numeric,
-            }
-        }
-
 class Float(Numeric):
     """A type for ``float`` numbers.
 
@@ -1413,29 +1509,6 @@ class Float(Numeric):
         else:
             return None
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.mul:{
-                Interval:Interval,
-                Numeric:Float,
-            },
-            # Py2K
-            operators.div:{
-                Numeric:Float,
-            },
-            # end Py2K
-            operators.truediv:{
-                Numeric:Float,
-            },
-            operators.add:{
-                Numeric:Float,
-            },
-            operators.sub:{
-                Numeric:Float,
-            }
-        }
-
 
 class DateTime(_DateAffinity, TypeEngine):
     """A type for ``datetime.datetime()`` objects.
@@ -1456,18 +1529,6 @@ class DateTime(_DateAffinity, TypeEngine):
     def get_dbapi_type(self, dbapi):
         return dbapi.DATETIME
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.add:{
-                Interval:DateTime,
-            },
-            operators.sub:{
-                Interval:DateTime,
-                DateTime:Interval,
-            },
-        }
-
 
 class Date(_DateAffinity,TypeEngine):
     """A type for ``datetime.date()`` objects."""
@@ -1477,30 +1538,6 @@ class Date(_DateAffinity,TypeEngine):
     def get_dbapi_type(self, dbapi):
         return dbapi.DATETIME
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.add:{
-                Integer:Date,
-                Interval:DateTime,
-                Time:DateTime,
-            },
-            operators.sub:{
-                # date - integer = date
-                Integer:Date,
-
-                # date - date = integer.
-                Date:Integer,
-
-                Interval:DateTime,
-
-                # date - datetime = interval,
-                # this one is not in the PG docs 
-                # but works
-                DateTime:Interval,
-            },
-        }
-
 
 class Time(_DateAffinity,TypeEngine):
     """A type for ``datetime.time()`` objects."""
@@ -1513,19 +1550,6 @@ class Time(_DateAffinity,TypeEngine):
     def get_dbapi_type(self, dbapi):
         return dbapi.DATETIME
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.add:{
-                Date:DateTime,
-                Interval:Time
-            },
-            operators.sub:{
-                Time:Interval,
-                Interval:Time,
-            },
-        }
-
 
 class _Binary(TypeEngine):
     """Define base behavior for binary types."""
@@ -1537,8 +1561,7 @@ class _Binary(TypeEngine):
     # here, though pg8000 does to indicate "bytea"
     def bind_processor(self, dialect):
         DBAPIBinary = dialect.dbapi.Binary
-        def process(value):
-            x = self
+        def process(value, DBAPIBinary=DBAPIBinary):
             if value is not None:
                 return DBAPIBinary(value)
             else:
@@ -1551,9 +1574,11 @@ class _Binary(TypeEngine):
     # Py2K
     def result_processor(self, dialect, coltype):
         if util.jython:
-            def process(value):
+            # array.array is bound as a default argument, saving the
+            # module global and attribute lookups on each row
+            def process(value, array_type=array.array):
                 if value is not None:
-                    if isinstance(value, array.array):
+                    if isinstance(value, array_type):
                         return value.tostring()
                     return str(value)
                 else:
@@ -1566,7 +1591,10 @@ class _Binary(TypeEngine):
     def _coerce_compared_value(self, op, value):
         """See :meth:`.TypeEngine._coerce_compared_value` for a description."""
 
-        if isinstance(value, basestring):
+        # the exact class test settles plain strings without the
+        # slower isinstance() check against basestring
+        if value.__class__ in _string_types or \
+                isinstance(value, basestring):
             return self
         else:
             return super(_Binary, self)._coerce_compared_value(op, value)
@@ -1650,6 +1678,13 @@ class SchemaType(events.SchemaEventTarget):
             table.metadata.append_ddl_listener('after-drop',
                     util.portable_instancemethod(self._on_metadata_drop))
 
+    @util.memoized_property
+    def _create_constraint_rule(self):
+        """The _create_rule of the CHECK constraints subclasses add for
+        each column using this type, built once and shared by them."""
+
+        return util.portable_instancemethod(self._should_create_constraint)
+
     @property
     def bind(self):
         return self.metadata and self.metadata.bind or None
@@ -1760,7 +1795,7 @@ class Enum(String, SchemaType):
                 convert_unicode = False
 
         if self.enums:
-            length =max(len(x) for x in self.enums)
+            length = max(map(len, self.enums))
         else:
             length = 0
         String.__init__(self, 
@@ -1781,8 +1816,7 @@ class Enum(String, SchemaType):
         e = schema.CheckConstraint(
                         column.in_(self.enums),
                         name=self.name,
-                        _create_rule=util.portable_instancemethod(
-                                        self._should_create_constraint)
+                        _create_rule=self._create_constraint_rule
                     )
         table.append_constraint(e)
 
@@ -1857,13 +1891,15 @@ class PickleType(MutableType, TypeDecorator):
         impl_processor = self.impl.bind_processor(dialect)
         dumps = self.pickler.dumps
         protocol = self.protocol
+        # bound as default arguments, read as fast locals on each row
         if impl_processor:
-            def process(value):
+            def process(value, dumps=dumps, protocol=protocol,
+                            impl_processor=impl_processor):
                 if value is not None:
                     value = dumps(value, protocol)
                 return impl_processor(value)
         else:
-            def process(value):
+            def process(value, dumps=dumps, protocol=protocol):
                 if value is not None:
                     value = dumps(value, protocol)
                 return value
@@ -1873,13 +1909,13 @@ class PickleType(MutableType, TypeDecorator):
         impl_processor = self.impl.result_processor(dialect, coltype)
         loads = self.pickler.loads
         if impl_processor:
-            def process(value):
+            def process(value, loads=loads, impl_processor=impl_processor):
                 value = impl_processor(value)
                 if value is None:
                     return None
                 return loads(value)
         else:
-            def process(value):
+            def process(value, loads=loads):
                 if value is None:
                     return None
                 return loads(value)
@@ -1943,8 +1979,7 @@ class Boolean(TypeEngine, SchemaType):
         e = schema.CheckConstraint(
                         column.in_([0, 1]),
                         name=self.name,
-                        _create_rule=util.portable_instancemethod(
-                                    self._should_create_constraint)
+                        _create_rule=self._create_constraint_rule
                     )
         table.append_constraint(e)
 
@@ -2018,12 +2053,12 @@ class Interval(_DateAffinity, TypeDecorator):
         impl_processor = self.impl.bind_processor(dialect)
         epoch = self.epoch
         if impl_processor:
-            def process(value):
+            def process(value, epoch=epoch, impl_processor=impl_processor):
                 if value is not None:
                     value = epoch + value
                 return impl_processor(value)
         else:
-            def process(value):
+            def process(value, epoch=epoch):
                 if value is not None:
                     value = epoch + value
                 return value
@@ -2033,43 +2068,18 @@ class Interval(_DateAffinity, TypeDecorator):
         impl_processor = self.impl.result_processor(dialect, coltype)
         epoch = self.epoch
         if impl_processor:
-            def process(value):
+            def process(value, epoch=epoch, impl_processor=impl_processor):
                 value = impl_processor(value)
                 if value is None:
                     return None
                 return value - epoch
         else:
-            def process(value):
+            def process(value, epoch=epoch):
                 if value is None:
                     return None
                 return value - epoch
         return process
 
-    @util.memoized_property
-    def _expression_adaptations(self):
-        return {
-            operators.add:{
-                Date:DateTime,
-                Interval:Interval,
-                DateTime:DateTime,
-                Time:Time,
-            },
-            operators.sub:{
-                Interval:Interval
-            },
-            operators.mul:{
-                Numeric:Interval
-            },
-            operators.truediv: {
-                Numeric:Interval
-            },
-            # Py2K
-            operators.div: {
-                Numeric:Interval
-            }
-            # end Py2K
-        }
-
     @property
     def _type_affinity(self):
         return Interval
@@ -2223,3 +2233,200 @@ _type_map = {
     NoneType: NULLTYPE
 }
 
+# subclasses of the Python types in _type_map -> type of their
+# nearest base in there, or NULLTYPE; see _resolve_type().  weak, so
+# that classes created at runtime can still be garbage collected
+_resolved_types = weakref.WeakKeyDictionary()
+
+def _resolve_type(pytype, _type_map=_type_map, _resolved=_resolved_types):
+    """Return the type for values of the Python type ``pytype``.
+
+    Values of a subclass of one of the types in ``_type_map`` get the
+    type of the nearest such base class, e.g. a ``str`` subclass is
+    a :class:`.String`.
+
+    """
+    type_ = _type_map.get(pytype)
+    if type_ is None:
+        type_ = _resolved.get(pytype)
+        if type_ is None:
+            for base in pytype.__mro__[1:]:
+                if base in _type_map:
+                    type_ = _type_map[base]
+                    break
+            else:
+                type_ = NULLTYPE
+            _resolved[pytype] = type_
+    return type_
+
+# exact classes of plain string values, see
+# _Binary._coerce_compared_value()
+_string_types = frozenset([str, unicode])
+
+# type affinity -> whether adding it to a Concatenable concatenates,
+# see Concatenable._adapt_expression()
+_concatenable_affinities = {}
+
+# module name of a type class -> dialect used by
+# TypeEngine.compile() when none is given
+_default_dialects = {}
+
+# the expression adaptations of the types above only depend on their
+# class and refer to classes declared after them, so they are written
+# out here, once all the classes exist, and set below as class
+# attributes shared by all instances
+
+# TODO: need a dictionary object that will
+# handle operators generically here, this is incomplete
+_integer_adaptations = {
+    operators.add:{
+        Date:Date,
+        Integer:Integer,
+        Numeric:Numeric,
+    },
+    operators.mul:{
+        Interval:Interval,
+        Integer:Integer,
+        Numeric:Numeric,
+    },
+    # Py2K
+    operators.div:{
+        Integer:Integer,
+        Numeric:Numeric,
+    },
+    # end Py2K
+    operators.truediv:{
+        Integer:Integer,
+        Numeric:Numeric,
+    },
+    operators.sub:{
+        Integer:Integer,
+        Numeric:Numeric,
+    },
+}
+
+_numeric_adaptations = {
+    operators.mul:{
+        Interval:Interval,
+        Numeric:Numeric,
+        Integer:Numeric,
+    },
+    # Py2K
+    operators.div:{
+        Numeric:Numeric,
+        Integer:Numeric,
+    },
+    # end Py2K
+    operators.truediv:{
+        Numeric:Numeric,
+        Integer:Numeric,
+    },
+    operators.add:{
+        Numeric:Numeric,
+        Integer:Numeric,
+    },
+    operators.sub:{
+        Numeric:Numeric,
+        Integer:Numeric,
+    }
+}
+
+_float_adaptations = {
+    operators.mul:{
+        Interval:Interval,
+        Numeric:Float,
+    },
+    # Py2K
+    operators.div:{
+        Numeric:Float,
+    },
+    # end Py2K
+    operators.truediv:{
+        Numeric:Float,
+    },
+    operators.add:{
+        Numeric:Float,
+    },
+    operators.sub:{
+        Numeric:Float,
+    }
+}
+
+_datetime_adaptations = {
+    operators.add:{
+        Interval:DateTime,
+    },
+    operators.sub:{
+        Interval:DateTime,
+        DateTime:Interval,
+    },
+}
+
+_date_adaptations = {
+    operators.add:{
+        Integer:Date,
+        Interval:DateTime,
+        Time:DateTime,
+    },
+    operators.sub:{
+        # date - integer = date
+        Integer:Date,
+
+        # date - date = integer.
+        Date:Integer,
+
+        Interval:DateTime,
+
+        # date - datetime = interval,
+        # this one is not in the PG docs 
+        # but works
+        DateTime:Interval,
+    },
+}
+
+_time_adaptations = {
+    operators.add:{
+        Date:DateTime,
+        Interval:Time
+    },
+    operators.sub:{
+        Time:Interval,
+        Interval:Time,
+    },
+}
+
+_interval_adaptations = {
+    operators.add:{
+        Date:DateTime,
+        Interval:Interval,
+        DateTime:DateTime,
+        Time:Time,
+    },
+    operators.sub:{
+        Interval:Interval
+    },
+    operators.mul:{
+        Numeric:Interval
+    },
+    operators.truediv: {
+        Numeric:Interval
+    },
+    # Py2K
+    operators.div: {
+        Numeric:Interval
+    }
+    # end Py2K
+}
+
+for _cls, _adaptations in ((Integer, _integer_adaptations),
+                           (Numeric, _numeric_adaptations),
+                           (Float, _float_adaptations),
+                           (DateTime, _datetime_adaptations),
+                           (Date, _date_adaptations),
+                           (Time, _time_adaptations),
+                           (Interval, _interval_adaptations)):
+    _cls._expression_adaptations = util.immutabledict(
+                (op, util.immutabledict(adaptations)) for op, adaptations
+                in _adaptations.iteritems())
+del _cls, _adaptations
+
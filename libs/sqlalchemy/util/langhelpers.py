@@ -15,6 +15,7 @@ import re
 import sys
 import types
 import warnings
+import weakref
 from compat import update_wrapper, set_types, threading, callable, inspect_getfullargspec, py3k
 from sqlalchemy import exc
 
@@ -660,14 +661,20 @@ def coerce_kw_type(kw, key, type_, flexi_bool=True):
             kw[key] = type_(kw[key])
 
 
+_constructor_kwargs = weakref.WeakKeyDictionary()
+
 def constructor_copy(obj, cls, **kw):
     """Instantiate cls using the __dict__ of obj as constructor arguments.
 
-    Uses inspect to match the named arguments of ``cls``.
+    Uses inspect to match the named arguments of ``cls``; the result
+    is remembered for each class.
 
     """
 
-    names = get_cls_kwargs(cls)
+    try:
+        names = _constructor_kwargs[cls]
+    except KeyError:
+        names = _constructor_kwargs[cls] = frozenset(get_cls_kwargs(cls))
     kw.update((k, obj.__dict__[k]) for k in names if k in obj.__dict__)
     return cls(**kw)
 
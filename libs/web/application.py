@@ -8,6 +8,7 @@ import debugerror
 from utils import lstrips, safeunicode
 import sys
 
+import re
 import urllib
 import traceback
 import itertools
@@ -111,6 +112,7 @@ class application:
 
     def init_mapping(self, mapping):
         self.mapping = list(utils.group(mapping, 2))
+        self._router = None
 
     def add_mapping(self, pattern, classname):
         self.mapping.append((pattern, classname))
@@ -412,7 +414,107 @@ class application:
         else:
             return web.notfound()
 
+    def _compile_router(self, mapping):
+        """Prepares `mapping` for `_match`, so that a path is resolved with a
+        dict lookup or a single `re.match` call instead of one call per url
+        pattern.
+
+        The patterns are grouped by their first path segment when it is
+        plain text. Each group is joined, together with the patterns that
+        can match any first segment, into one regular expression.
+
+        Returns a tuple `(literals, buckets, default)`, or None when the
+        mapping can not be combined. `literals` maps the patterns without
+        any regex syntax, that come before the first pattern with some, to
+        what they point to. `buckets` maps a first path segment to the
+        `(regex, routes)` to try for it and `default` is the `(regex, routes)`
+        for any other path, where `routes` maps the index of the group
+        wrapping each pattern to `(pattern, what, ngroups)`.
+        
+            >>> app = application()
+            >>> literals, buckets, default = app._compile_router([('/b', 'b'), ('/a/(.*)', 'a'), ('/(c)', 'c')])
+            >>> literals
+            {'/b': 'b'}
+            >>> sorted(buckets)
+            ['a', 'b']
+            >>> regex, routes = buckets['a']
+            >>> m = regex.match('/a/x')
+            >>> routes[m.lastindex]
+            ('/a/(.*)', 'a', 1)
+            >>> regex, routes = default
+            >>> [routes[i][0] for i in sorted(routes)]
+            ['/(c)']
+        """
+        entries, literals = [], {}
+        only_literals = True
+        for pat, what in mapping:
+            # sub-applications match on prefix, inline flags apply to the
+            # whole expression and numbered backreferences would point to
+            # the wrong group once the patterns are joined.
+            if isinstance(what, application) or _unjoinable_pattern(pat):
+                return None
+            # re_subm searches, so an alternation can match inside the path
+            if isinstance(what, basestring) and '|' in pat:
+                return None
+            try:
+                ngroups = utils.re_compile(pat).groups
+            except re.error:
+                return None
+            only_literals = (only_literals and _literal_pattern(pat) is not None
+                and not (isinstance(what, basestring) and '\\' in what))
+            if only_literals:
+                literals.setdefault(pat, what)
+            segment = None
+            if '|' not in pat:
+                segment = _first_segment(pat)
+            entries.append((segment and segment.group(1), pat, what, ngroups))
+
+        def join(segment):
+            parts, routes = [], {}
+            index = 1
+            for seg, pat, what, ngroups in entries:
+                if seg is None or seg == segment:
+                    parts.append('(^%s$)' % pat)
+                    routes[index] = (pat, what, ngroups)
+                    index += ngroups + 1
+            # an empty expression would match any path
+            regex = parts and re.compile('|'.join(parts)) or None
+            return regex, routes
+
+        try:
+            segments = set(seg for seg, pat, what, ngroups in entries if seg is not None)
+            buckets = dict((seg, join(seg)) for seg in segments)
+            default = join(None)
+        except (re.error, AssertionError, OverflowError):
+            # python limits the number of groups in a regular expression
+            return None
+        return literals, buckets, default
+
     def _match(self, mapping, value):
+        router = self._router
+        if router is None or router[0] is not mapping or router[1] != len(mapping):
+            router = self._router = (mapping, len(mapping), self._compile_router(mapping))
+        if router[2]:
+            literals, buckets, default = router[2]
+            if value in literals:
+                return literals[value], []
+            segment = value.split('/', 2)[1:2]
+            if segment and segment[0].endswith('\n'):
+                # '$' also matches before a trailing newline, so
+                # '/login\n' belongs in the bucket of '/login'
+                segment = [segment[0][:-1]]
+            regex, routes = segment and buckets.get(segment[0]) or default
+            result = regex and regex.match(value)
+            if not result:
+                return None, None
+            # the group wrapping a pattern closes after the groups in it
+            index = result.lastindex
+            pat, what, ngroups = routes[index]
+            if isinstance(what, basestring):
+                what, result = utils.re_subm('^' + pat + '$', what, value)
+                return what, [x for x in result.groups()]
+            return what, list(result.groups()[index:index+ngroups])
+
         for pat, what in mapping:
             if isinstance(what, application):
                 if value.startswith(pat):
@@ -468,6 +570,10 @@ class application:
         else:
             return web._InternalError()
 
+_unjoinable_pattern = re.compile(r'\(\?[iLmsux]|\\[1-9]').search
+_literal_pattern = re.compile(r'[^.^$*+?{}\[\]\\|()]*$').match
+_first_segment = re.compile(r'/([\w-]+)(?:/|$)').match
+
 class auto_application(application):
     """Application similar to `application` but urls are constructed 
     automatiacally using metaclass.
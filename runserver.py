@@ -10,7 +10,9 @@ def load_urls():
     return urls_all
 
 urls = load_urls()
-application = web.application(urls, autoreload=True)
+# reloading checks every loaded module's mtime on each request, so it
+# is only done when developing with `python runserver.py`
+application = web.application(urls, autoreload=__name__ == '__main__')
 
 if __name__ == '__main__':
     web.config.debug = True
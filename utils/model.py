@@ -2,10 +2,34 @@
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import instance_state
 from sqlalchemy.ext.declarative import declarative_base
 
 import settings
 
 engine = create_engine(settings.database)
-Session = sessionmaker(engine)
-BaseModel = declarative_base()
\ No newline at end of file
+# objects stay loaded after commit() instead of being re-SELECTed on
+# their next attribute access
+Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+
+class _BaseModel(object):
+    # attributes `by_id` makes sure are loaded on the returned object
+    _hot_columns = frozenset()
+
+    @classmethod
+    def by_id(cls, session, id):
+        """Returns the object with the primary key `id`, or None.
+
+        An object already in the session's identity map is returned
+        without a SELECT, and only its unloaded hot columns are refreshed.
+        """
+        obj = session.query(cls).get(id)
+        if obj is None:
+            return None
+        unloaded = instance_state(obj).unloaded & cls._hot_columns
+        if unloaded:
+            session.refresh(obj, list(unloaded))
+        return obj
+
+BaseModel = declarative_base(cls=_BaseModel)
\ No newline at end of file
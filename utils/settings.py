@@ -1,3 +1,6 @@
 
 
-database = "sqlite:////../test.db"
\ No newline at end of file
+database = "sqlite:////../test.db"
+
+# re-read templates changed on disk, costs a stat() per template lookup
+template_reload = False
\ No newline at end of file
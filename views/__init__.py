@@ -3,14 +3,27 @@
 import os
 from mako.lookup import TemplateLookup as _MakoTemplateLookup
 
+from utils import settings
+
 
 
 _FACTORY = _MakoTemplateLookup(directories=[os.path.dirname(__file__)],
                                         input_encoding="utf-8",
-                                        output_encoding="utf-8",)
+                                        output_encoding="utf-8",
+                                        filesystem_checks=settings.template_reload,)
+
 
+# uri as passed to Template() -> compiled template; left empty when
+# template_reload is on, so Mako still gets to check the files
+_TEMPLATES = {}
 
 def Template(uri):
-    if not uri.endswith(".html"):
-        uri = uri + ".html"
-    return _FACTORY.get_template(uri)
\ No newline at end of file
+    template = _TEMPLATES.get(uri)
+    if template is None:
+        name = uri
+        if not name.endswith(".html"):
+            name = name + ".html"
+        template = _FACTORY.get_template(name)
+        if not settings.template_reload:
+            _TEMPLATES[uri] = template
+    return template
\ No newline at end of file